@@ -7,7 +7,7 @@ from contract import Contract, TermContract, PrepaidContract, MTMContract
 from customer import Customer
 from phoneline import PhoneLine
 from visualizer import Visualizer
-from call import Call
+from call import Call, preload_sprites
 
 
 def import_data() -> dict[str, list[dict]]:
@@ -135,6 +135,7 @@ def process_event_history(log: dict[str, list[dict]],
 
 if __name__ == '__main__':
     v = Visualizer()
+    preload_sprites()
     print("Toronto map coordinates:")
     print("  Lower-left corner: -79.697878, 43.576959")
     print("  Upper-right corner: -79.196382, 43.799568")
@@ -164,14 +165,12 @@ if __name__ == '__main__':
     while not v.has_quit():
         events = v.handle_window_events(customers, events)
 
-        connections = []
         drawables = []
         for event in events:
-            connections.append(event.get_connection())
             drawables.extend(event.get_drawables())
 
         # Put the connections on top of the other sprites
-        drawables.extend(connections)
+        drawables.extend(event.get_connection() for event in events)
         v.render_drawables(drawables)
 
     import python_ta
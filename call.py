@@ -8,6 +8,37 @@ import pygame
 START_CALL_SPRITE = 'data/call-start-2.png'
 END_CALL_SPRITE = 'data/call-end-2.png'
 
+# Size (in pixels) that call sprites are scaled to before being drawn
+SPRITE_SIZE = (13, 13)
+
+# Loaded and scaled sprite surfaces, shared by all drawables using the same
+# sprite file and size
+_SPRITE_CACHE: dict[tuple[str, tuple[int, int]], pygame.Surface] = {}
+
+
+def _load_sprite(sprite_file: str,
+                 size: tuple[int, int] = SPRITE_SIZE) -> pygame.Surface:
+    """Return the surface for <sprite_file> scaled to <size>, loading it from
+    disk only the first time it is requested.
+
+    The returned surface is shared between callers and must not be modified.
+    """
+    key = (sprite_file, size)
+    sprite = _SPRITE_CACHE.get(key)
+    if sprite is None:
+        sprite = pygame.image.load(os.path.join(os.path.dirname(__file__),
+                                                sprite_file))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        sprite = pygame.transform.scale(sprite, size)
+        _SPRITE_CACHE[key] = sprite
+    return sprite
+
+
+def preload_sprites() -> None:
+    """Load the call sprites into the sprite cache ahead of time."""
+    for sprite_file in (START_CALL_SPRITE, END_CALL_SPRITE):
+        _load_sprite(sprite_file)
 
 
 class Drawable:
@@ -22,6 +53,8 @@ class Drawable:
         If none, then must have sprite
     loc: location (longitude/latitude pair)
     """
+    __slots__ = ('sprite', 'linelimits', 'loc')
+
     sprite: Optional[pygame.Surface]
     linelimits: Optional[tuple[float, float]]
     loc: Optional[tuple[float, float]]
@@ -39,9 +72,7 @@ class Drawable:
         self.loc = None
 
         if sprite_file is not None and location is not None:
-            self.sprite = pygame.transform.smoothscale(
-                pygame.image.load(os.path.join(os.path.dirname(__file__),
-                                               sprite_file)), (13, 13))
+            self.sprite = _load_sprite(sprite_file)
             self.loc = location
         else:
             self.linelimits = linelimits
@@ -77,22 +108,30 @@ class Call:
          location of the destination of this Call; a Tuple containing the
          longitude and latitude coordinates
     drawables:
-         sprites for drawing the source and destination of this Call
+         sprites for drawing the source and destination of this Call, or None
+         until they are first requested
     connection:
          connecting line between the two sprites representing the source and
-         destination of this Call
+         destination of this Call, or None until it is first requested
 
     === Representation Invariants ===
     -   duration >= 0
     """
+    __slots__ = ('src_number', 'dst_number', 'time', 'duration', 'src_loc',
+                 'dst_loc', 'drawables', 'connection', '_bill_date')
+
+    # === Private Attributes ===
+    # _bill_date:
+    #     the (month, year) billing date of this Call, computed once from time
     src_number: str
     dst_number: str
     time: datetime.datetime
     duration: int
     src_loc: tuple[float, float]
     dst_loc: tuple[float, float]
-    drawables: list[Drawable]
-    connection: Drawable
+    drawables: Optional[list[Drawable]]
+    connection: Optional[Drawable]
+    _bill_date: tuple[int, int]
 
     def __init__(self, src_nr: str, dst_nr: str,
                  calltime: datetime.datetime, duration: int,
@@ -103,38 +142,58 @@ class Call:
         self.src_number = src_nr
         self.dst_number = dst_nr
         self.time = calltime
+        self._bill_date = (calltime.month, calltime.year)
         self.duration = duration
         self.src_loc = src_loc
         self.dst_loc = dst_loc
-        self.drawables = [Drawable(sprite_file=START_CALL_SPRITE,
-                                   location=src_loc),
-                          Drawable(sprite_file=END_CALL_SPRITE,
-                                   location=dst_loc)]
-
-        self.connection = Drawable(linelimits=(src_loc, dst_loc))
+        self.drawables = None
+        self.connection = None
 
     def get_bill_date(self) -> tuple[int, int]:
         """ Return the billing date for this Call, as a tuple containing the
         month and the year
         """
-        return self.time.month, self.time.year
+        return self._bill_date
 
 
     def get_drawables(self) -> list[Drawable]:
         """ Return the list of drawable sprites for this Call
         """
+        if self.drawables is None:
+            self.drawables = [Drawable(sprite_file=START_CALL_SPRITE,
+                                       location=self.src_loc),
+                              Drawable(sprite_file=END_CALL_SPRITE,
+                                       location=self.dst_loc)]
         return self.drawables
 
     def get_connection(self) -> Drawable:
         """ Return the connecting line for this Call start and end locations
         """
+        if self.connection is None:
+            self.connection = Drawable(linelimits=(self.src_loc, self.dst_loc))
         return self.connection
 
     def __str__(self) -> str:
         """ Return the string representation of a Call"""
-        return "srcnum" + self.src_number + "srcdst" + self.dst_number + "time"\
-            + str(self.time) + "dur" + str(self.duration) + "srcloc"\
-            + str(self.src_loc) + "dstloc" + str(self.dst_loc)
+        return f"srcnum{self.src_number}srcdst{self.dst_number}" \
+            f"time{self.time}dur{self.duration}" \
+            f"srcloc{self.src_loc}dstloc{self.dst_loc}"
+
+    def __eq__(self, other: object) -> bool:
+        """ Return whether <other> is a Call between the same numbers, at the
+        same time and with the same duration as this Call.
+        """
+        if not isinstance(other, Call):
+            return NotImplemented
+        return (self.src_number, self.dst_number, self.time, self.duration) \
+            == (other.src_number, other.dst_number, other.time,
+                other.duration)
+
+    def __hash__(self) -> int:
+        """ Return a hash of this Call, consistent with __eq__
+        """
+        return hash((self.src_number, self.dst_number, self.time,
+                     self.duration))
 
 
 if __name__ == '__main__':
@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from call import Call
 
 
@@ -12,33 +14,35 @@ class CallHistory:
          Dictionary of outgoing calls. Keys are tuples containing a month and a
          year, values are a List of Call objects for that month and year.
     """
+    # === Private Attributes ===
+    # _all_outgoing:
+    #     every outgoing call in this history, in registration order
+    # _all_incoming:
+    #     every incoming call in this history, in registration order
     incoming_calls: dict[tuple[int, int], list[Call]]
     outgoing_calls: dict[tuple[int, int], list[Call]]
+    _all_outgoing: list[Call]
+    _all_incoming: list[Call]
 
     def __init__(self) -> None:
         """ Create an empty CallHistory.
         """
-        self.outgoing_calls = {}
-        self.incoming_calls = {}
+        self.outgoing_calls = defaultdict(list)
+        self.incoming_calls = defaultdict(list)
+        self._all_outgoing = []
+        self._all_incoming = []
 
     def register_outgoing_call(self, call: Call) -> None:
         """ Register a Call <call> into this outgoing call history
         """
-        find = (call.time.month, call.time.year)
-        if find in self.outgoing_calls:
-            self.outgoing_calls[find].append(call)
-        else:
-            self.outgoing_calls[find] = [call]
+        self.outgoing_calls[call.get_bill_date()].append(call)
+        self._all_outgoing.append(call)
 
     def register_incoming_call(self, call: Call) -> None:
         """ Register a Call <call> into this incoming call history
         """
-
-        find = (call.time.month, call.time.year)
-        if find in self.incoming_calls:
-            self.incoming_calls[find].append(call)
-        else:
-            self.incoming_calls[find] = [call]
+        self.incoming_calls[call.get_bill_date()].append(call)
+        self._all_incoming.append(call)
 
 
     def get_monthly_history(self, month: int = None, year: int = None) -> \
@@ -55,30 +59,18 @@ class CallHistory:
         - if <month> and <year> are specified (non-None), they are both valid
         monthly cycles according to the input dataset
         """
-        monthly_history = ([], [])
         if month is not None and year is not None:
-            if (month, year) in self.outgoing_calls:
-                for call in self.outgoing_calls[(month, year)]:
-                    monthly_history[0].append(call)
+            return (list(self.outgoing_calls.get((month, year), ())),
+                    list(self.incoming_calls.get((month, year), ())))
 
-            if (month, year) in self.incoming_calls:
-                for call in self.incoming_calls[(month, year)]:
-                    monthly_history[1].append(call)
-        else:
-            for entry in self.outgoing_calls:
-                for call in self.outgoing_calls[entry]:
-                    monthly_history[0].append(call)
-            for entry in self.incoming_calls:
-                for call in self.incoming_calls[entry]:
-                    monthly_history[1].append(call)
-        return monthly_history
+        return list(self._all_outgoing), list(self._all_incoming)
 
 
 if __name__ == '__main__':
     import python_ta
     python_ta.check_all(config={
         'allowed-import-modules': [
-            'python_ta', 'typing', 'datetime', 'call'
+            'python_ta', 'typing', 'datetime', 'collections', 'call'
             ''
         ],
         'disable': ['R0902', 'R0913'],
@@ -1,5 +1,4 @@
 import datetime
-from math import ceil
 from typing import Optional
 from bill import Bill
 from call import Call
@@ -23,6 +22,13 @@ TERM_MINS_COST = 0.1
 PREPAID_MINS_COST = 0.025
 
 
+def _minutes(seconds: int) -> int:
+    """ Return the number of started minutes in <seconds>, i.e. <seconds>
+    converted to minutes and rounded up.
+    """
+    return -(-seconds // 60)
+
+
 class Contract:
     """ A contract for a phone line
 
@@ -63,7 +69,7 @@ class Contract:
         was made. In other words, you can safely assume that self.bill has been
         already advanced to the right month+year.
         """
-        self.bill.add_billed_minutes(ceil(call.duration / 60.0))
+        self.bill.add_billed_minutes(_minutes(call.duration))
 
     def cancel_contract(self) -> float:
         """ Return the amount owed in order to close the phone line associated
@@ -118,17 +124,11 @@ class TermContract (Contract):
     def bill_call(self, call: Call) -> None:
         """ Add the <call> to the bill, properly handling free minutes. """
 
-        call_time = ceil(call.duration / 60.0)
-        excess = call_time - (TERM_MINS - self.bill.free_min)
-
-        if (self.bill.free_min + call_time) < TERM_MINS:
-            self.bill.free_min += call_time
-        elif (self.bill.free_min - TERM_MINS) != 0:
-            self.bill.free_min += call_time - excess
-            self.bill.add_free_minutes(self.bill.free_min)
-            self.bill.add_billed_minutes(excess)
-        else:
-            self.bill.add_billed_minutes(excess)
+        call_time = _minutes(call.duration)
+        free_left = TERM_MINS - self.bill.free_min
+        used = min(call_time, max(free_left, 0))
+        self.bill.add_free_minutes(used)
+        self.bill.add_billed_minutes(call_time - used)
 
     def cancel_contract(self) -> float:
         """ Return the amount owed in order to close the phone line associated
@@ -207,8 +207,9 @@ class PrepaidContract(Contract):
         was made. In other words, you can safely assume that self.bill has been
         already advanced to the right month+year.
         """
-        self.balance += ((ceil(call.duration / 60.0)) * PREPAID_MINS_COST)
-        self.bill.add_billed_minutes(ceil(call.duration / 60.0))
+        mins = _minutes(call.duration)
+        self.balance += mins * PREPAID_MINS_COST
+        self.bill.add_billed_minutes(mins)
 
     def cancel_contract(self) -> float:
         """ Return the amount owed in order to close the phone line associated
@@ -230,7 +231,7 @@ if __name__ == '__main__':
     import python_ta
     python_ta.check_all(config={
         'allowed-import-modules': [
-            'python_ta', 'typing', 'datetime', 'bill', 'call', 'math'
+            'python_ta', 'typing', 'datetime', 'bill', 'call'
         ],
         'disable': ['R0902', 'R0913'],
         'generated-members': 'pygame.*'
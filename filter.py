@@ -1,11 +1,65 @@
+import itertools
+import re
 import time
 import datetime
+from typing import Iterable, Optional
 
 
 from call import Call
 from customer import Customer
 
 
+# Map boundaries for LocationFilter, matching the map drawn by the visualizer
+MAP_MIN = (-79.697878, 43.799568)
+MAP_MAX = (-79.196382, 43.576959)
+
+# A valid DurationFilter string: 'G' or 'L' followed by up to three digits
+_DURATION_RE = re.compile(r'([GL])(\d{1,3})')
+
+
+# Customer lookup tables by customer id, keyed by the id() of the customer list
+# they were built from. The list itself is kept alongside its table so that a
+# reused id() or a list that has since grown is detected and rebuilt.
+_CUSTOMER_INDEX_CACHE: dict[int, tuple[list[Customer], int,
+                                       dict[int, Customer]]] = {}
+
+
+def _customer_index(customers: list[Customer]) -> dict[int, Customer]:
+    """ Return a dictionary mapping each customer id to its customer in
+    <customers>, reusing the one built for this list previously if possible.
+    """
+    cached = _CUSTOMER_INDEX_CACHE.get(id(customers))
+    if cached is not None and cached[0] is customers \
+            and cached[1] == len(customers):
+        return cached[2]
+    index = {customer.get_id(): customer for customer in customers}
+    _CUSTOMER_INDEX_CACHE[id(customers)] = (customers, len(customers), index)
+    return index
+
+
+def _dedup_calls(calls: Iterable[Call]) -> list[Call]:
+    """ Return a list of the calls in <calls> with duplicates removed, keeping
+    the first occurrence of each call in its original order.
+    """
+    return list(dict.fromkeys(calls))
+
+
+def _parse_bbox(filter_string: str) \
+        -> Optional[tuple[float, float, float, float]]:
+    """ Return the (lowerLong, lowerLat, upperLong, upperLat) coordinates in
+    <filter_string>, or None if it is not four comma and space separated
+    numbers.
+    """
+    parts = filter_string.split(", ")
+    if len(parts) != 4:
+        return None
+    try:
+        return float(parts[0]), float(parts[1]), float(parts[2]), \
+            float(parts[3])
+    except ValueError:
+        return None
+
+
 class Filter:
     """ A class for filtering customer data on some criterion. A filter is
     applied to a set of calls.
@@ -62,12 +116,9 @@ class ResetFilter(Filter):
         Precondition:
         - <customers> contains the list of all customers from the input dataset
         """
-        filtered_calls = []
-        for c in customers:
-            customer_history = c.get_history()
-            # only take outgoing calls, we don't want to include calls twice
-            filtered_calls.extend(customer_history[0])
-        return filtered_calls
+        # only take outgoing calls, we don't want to include calls twice
+        return list(itertools.chain.from_iterable(
+            c.get_history()[0] for c in customers))
 
     def __str__(self) -> str:
         """ Return a description of this filter to be displayed in the UI menu
@@ -96,26 +147,19 @@ class CustomerFilter(Filter):
 
         Do not mutate any of the function arguments!
         """
-        filter_calls = []
-        unique_calls = []
         try:
-            int(filter_string)
+            cid = int(filter_string)
         except ValueError:
             return data
 
-        for customer in customers:
-            if customer.get_id() == int(filter_string):
-                filter_calls.extend(customer.get_history()[0] + customer.get_history()[1])
-
-        for call in filter_calls:
-            if call not in filter_calls:
-                unique_calls.append(call)
-
-        if unique_calls:
-            return unique_calls
-        else:
+        customer = _customer_index(customers).get(cid)
+        if customer is None:
             return data
 
+        history = customer.get_history()
+        customer_calls = set(itertools.chain(history[0], history[1]))
+        return _dedup_calls(call for call in data if call in customer_calls)
+
     def __str__(self) -> str:
         """ Return a description of this filter to be displayed in the UI menu
         """
@@ -145,26 +189,14 @@ class DurationFilter(Filter):
 
         Do not mutate any of the function arguments!
         """
-        unique_call = []
-        try:
-            int(str(filter_string)[1:])
-
-            if len(str(filter_string)) > 4 or len(str(filter_string)) < 2:
-                return data
-            elif filter_string[0] != 'G' and filter_string[0] != 'L':
-                return data
-        except ValueError:
+        match = _DURATION_RE.fullmatch(filter_string)
+        if match is None:
             return data
-        except IndexError:
-            return data
-        for dat in data:
-            if str(filter_string[0]) == 'G':
-                if dat.duration > int(str(filter_string[1:])):
-                    unique_call.append(dat)
-            elif str(filter_string[0]) == 'L':
-                if dat.duration < int(str(filter_string[1:])):
-                    unique_call.append(dat)
-        return unique_call
+        op, threshold = match.group(1), int(match.group(2))
+
+        if op == 'G':
+            return [dat for dat in data if dat.duration > threshold]
+        return [dat for dat in data if dat.duration < threshold]
 
     def __str__(self) -> str:
         """ Return a description of this filter to be displayed in the UI menu
@@ -203,37 +235,22 @@ class LocationFilter(Filter):
 
         Do not mutate any of the function arguments!
         """
-        MAP_MIN = (-79.697878, 43.799568)
-        MAP_MAX = (-79.196382, 43.576959)
-        lowerlong, lowerlat, upperlong, upperlat = 0, 1, 2, 3
-        try:
-            coor = filter_string.split(", ")
-            for i in range(4):
-                float(coor[i])
-
-            if (float(coor[lowerlong]) < MAP_MIN[0]
-                    or float(coor[upperlong]) > MAP_MAX[0]
-                    or float(coor[lowerlat]) < MAP_MIN[1]
-                    or float(coor[lowerlat]) > MAP_MAX[1]):
-
-                return data
-
-        except ValueError:
+        bbox = _parse_bbox(filter_string)
+        if bbox is None:
             return data
-        except IndexError:
-            return data
-
-        coor = filter_string.split(", ")
+        lowerlong, lowerlat, upperlong, upperlat = bbox
 
-        unique_list = []
-        for dat in data:
-            if ((float(coor[lowerlong]) <= dat.src_loc[0] <= float(coor[upperlong])
-                and float(coor[lowerlat])<= dat.src_loc[1] <= float(coor[upperlat]))
-                or (float(coor[lowerlong]) <= dat.dst_loc[0] <= float(coor[upperlong])
-                and float(coor[lowerlat]) <= dat.dst_loc[1] <= float(coor[upperlat]))):
-                unique_list.append(dat)
+        if (lowerlong < MAP_MIN[0]
+                or upperlong > MAP_MAX[0]
+                or lowerlat < MAP_MIN[1]
+                or lowerlat > MAP_MAX[1]):
+            return data
 
-        return unique_list
+        return [dat for dat in data
+                if (lowerlong <= dat.src_loc[0] <= upperlong
+                    and lowerlat <= dat.src_loc[1] <= upperlat)
+                or (lowerlong <= dat.dst_loc[0] <= upperlong
+                    and lowerlat <= dat.dst_loc[1] <= upperlat)]
 
 
 
@@ -249,7 +266,8 @@ if __name__ == '__main__':
     import python_ta
     python_ta.check_all(config={
         'allowed-import-modules': [
-            'python_ta', 'typing', 'time', 'datetime', 'call', 'customer'
+            'python_ta', 'typing', 'itertools', 're', 'time', 'datetime',
+            'call', 'customer'
         ],
         'max-nested-blocks': 4,
         'allowed-io': ['apply', '__str__'],
@@ -3,6 +3,7 @@ import datetime
 import pytest
 
 from application import create_customers, process_event_history
+from call import Call
 from contract import TermContract, MTMContract, PrepaidContract
 from customer import Customer
 from filter import DurationFilter, CustomerFilter, ResetFilter
@@ -157,6 +158,22 @@ def test_events() -> None:
     assert len(history[0].outgoing_calls) == 1
 
 
+def test_term_contract_free_minutes() -> None:
+    """ Test that term contract calls use up the free minutes first and are
+    billed only for the minutes past them.
+    """
+    customer = create_single_customer_with_all_lines()
+    customer.new_month(1, 2018)
+    for duration in [90 * 60, 15 * 60 + 1, 5 * 60]:
+        customer.make_call(Call('867-5309', '273-8255',
+                                datetime.datetime(2018, 1, 2), duration,
+                                (-79.4, 43.6), (-79.5, 43.7)))
+
+    summary = customer.generate_bill(1, 2018)[2][0]
+    assert summary['free_mins'] == 100
+    assert summary['billed_mins'] == 11
+
+
 def test_contract_start_dates() -> None:
     """ Test the start dates of the contracts.
 
@@ -217,5 +234,36 @@ def test_filters() -> None:
             assert len(result) == expected_return_lengths[i][j]
 
 
+def test_customer_filter_keeps_only_given_calls() -> None:
+    """ Test that the customer filter only returns the calls from its input
+    data that involve the given customer, in the same order.
+    """
+    log = {'events': test_dict['events'] + [
+        {"type": "call",
+         "src_number": "111-1111",
+         "dst_number": "222-2222",
+         "time": "2018-01-01 01:01:07",
+         "duration": 20,
+         "src_loc": [-79.42848154284123, 43.641401675960374],
+         "dst_loc": [-79.52745693913239, 43.750338501653374]}
+    ],
+        'customers': test_dict['customers'] + [
+            {'lines': [{'number': '111-1111', 'contract': 'mtm'}],
+             'id': 1111},
+            {'lines': [{'number': '222-2222', 'contract': 'mtm'}],
+             'id': 2222}
+        ]
+    }
+    customers = create_customers(log)
+    process_event_history(log, customers)
+    calls = []
+    for c in customers:
+        calls.extend(c.get_history()[0])
+
+    result = CustomerFilter().apply(customers, calls, "7777")
+    assert result == customers[0].get_history()[0]
+    assert CustomerFilter().apply(customers, calls[::-1], "2222") == [calls[3]]
+    assert CustomerFilter().apply(customers, calls, "3333") == calls
+
 if __name__ == '__main__':
     pytest.main(['sample_tests.py'])
@@ -362,18 +362,27 @@ class Map:
     def render_objects(self, drawables: list[Drawable],
                        screen: pygame.Surface) -> None:
         """ Render the <drawables> onto the <screen>.
+
+        Consecutive sprites are blitted together in a single Surface.blits
+        call, so drawables still appear in the order given.
         """
+        sprites = []
         for drawable in drawables:
             longlat_position = drawable.get_position()
             if longlat_position is not None:
                 sprite_position = self._longlat_to_screen(longlat_position)
-                screen.blit(drawable.sprite, sprite_position)
+                sprites.append((drawable.sprite, sprite_position))
             else:  # is a line segment
+                if sprites:
+                    screen.blits(sprites, doreturn=False)
+                    sprites = []
                 endpoints = drawable.get_linelimits()
                 pygame.draw.aaline(screen,
                                    LINE_COLOUR,
                                    self._longlat_to_screen(endpoints[0]),
                                    self._longlat_to_screen(endpoints[1]))
+        if sprites:
+            screen.blits(sprites, doreturn=False)
 
     def _longlat_to_screen(self,
                            location: tuple[float, float]) -> tuple[int, int]: